@@ -20,10 +20,108 @@
 # see <https://www.lsstcorp.org/LegalNotices/>.
 #
 
-__all__ = ['getCallerFrame', 'getStackFrame', 'StackFrame', 'getCallStack']
+__all__ = ['getCallerFrame', 'getStackFrame', 'StackFrame', 'getCallStack', 'setRecordCallStacks']
 
-import inspect
+import os
+import sys
 import linecache
+import warnings
+
+
+def _getEnvInt(name, default):
+    """Read an integer setting from the environment.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the environment variable.
+    default : `int`
+        Value to use if the variable is not set or is not an integer.
+
+    Returns
+    -------
+    value : `int`
+        The setting.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        warnings.warn("Ignoring %s=%r: not an integer; using %d" % (name, value, default))
+        return default
+
+
+_CALL_STACK_LIMIT = _getEnvInt("META_CONFIG_CALL_STACK_LIMIT", 16)
+"""Default maximum number of frames recorded by `getCallStack`.
+
+Read from the ``META_CONFIG_CALL_STACK_LIMIT`` environment variable; a value
+of zero or less records the complete stack.
+"""
+
+
+def _getEnvBool(name, default):
+    """Read a boolean setting from the environment.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the environment variable.
+    default : `bool`
+        Value to use if the variable is not set or not recognized.
+
+    Returns
+    -------
+    value : `bool`
+        The setting. ``1``, ``true``, ``yes`` and ``on`` are `True`; ``0``,
+        ``false``, ``no`` and ``off`` are `False` (case-insensitive).
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    flag = value.strip().lower()
+    if flag in ("1", "true", "yes", "on"):
+        return True
+    if flag in ("0", "false", "no", "off"):
+        return False
+    warnings.warn("Ignoring %s=%r: not a boolean; using %s" % (name, value, default))
+    return default
+
+
+_RECORD_CALL_STACKS = _getEnvBool("META_CONFIG_RECORD_CALL_STACKS", True)
+"""Whether `getCallStack` records any frames at all.
+
+Initialized from the ``META_CONFIG_RECORD_CALL_STACKS`` environment variable
+and changed at run time with `setRecordCallStacks`.
+"""
+
+
+def setRecordCallStacks(record):
+    """Switch recording of call stacks in configuration history on or off.
+
+    Parameters
+    ----------
+    record : `bool`
+        If `False`, `getCallStack` returns an empty stack, so configuration
+        history keeps the values and labels of each change but not where they
+        were made.
+
+    Returns
+    -------
+    previous : `bool`
+        The setting before this call, so that it can be restored.
+
+    Notes
+    -----
+    The setting is process-wide. The initial value comes from the
+    ``META_CONFIG_RECORD_CALL_STACKS`` environment variable and defaults to
+    `True`.
+    """
+    global _RECORD_CALL_STACKS
+    previous = _RECORD_CALL_STACKS
+    _RECORD_CALL_STACKS = bool(record)
+    return previous
 
 
 def getCallerFrame(relative=0):
@@ -36,17 +134,18 @@ def getCallerFrame(relative=0):
 
     Returns
     -------
-    frame : `__builtin__.Frame`
-        Frame for the caller.
+    frame : `__builtin__.Frame` or `None`
+        Frame for the caller, or `None` if the stack is not that deep.
 
     Notes
     -----
     This function is excluded from the frame.
     """
-    frame = inspect.currentframe().f_back.f_back  # Our caller's caller
-    for ii in range(relative):
-        frame = frame.f_back
-    return frame
+    try:
+        return sys._getframe(relative + 2)  # Our caller's caller
+    except ValueError:
+        # Asked for a frame above the outermost one.
+        return None
 
 
 def getStackFrame(relative=0):
@@ -96,6 +195,8 @@ class StackFrame:
     getStackFrame
     """
 
+    __slots__ = ("filename", "lineno", "function", "_content")
+
     _STRIP = "/python/lsst/"
     """String to strip from the ``filename`` in the constructor."""
 
@@ -166,27 +267,39 @@ class StackFrame:
         return result
 
 
-def getCallStack(skip=0):
+def getCallStack(skip=0, limit=None):
     """Retrieve the call stack for the caller.
 
     Parameters
     ----------
     skip : `int`, non-negative
         Number of stack frames above caller to skip.
+    limit : `int`, optional
+        Maximum number of frames to retrieve, counting outwards from the
+        caller. If `None`, ``_CALL_STACK_LIMIT`` is used. A value of zero or
+        less retrieves the complete stack.
 
     Returns
     -------
     output : `list` of `StackFrame`
         The call stack. The `list` is ordered with the most recent frame to
-        last.
+        last. It is empty if recording was switched off with
+        `setRecordCallStacks`.
 
     Notes
     -----
     This function is excluded from the call stack.
     """
+    if not _RECORD_CALL_STACKS:
+        return []
+    if limit is None:
+        limit = _CALL_STACK_LIMIT
     frame = getCallerFrame(skip + 1)
     stack = []
     while frame:
         stack.append(StackFrame.fromFrame(frame))
+        if len(stack) == limit:
+            break
         frame = frame.f_back
-    return list(reversed(stack))
+    stack.reverse()
+    return stack
@@ -70,12 +70,13 @@ class ChoiceField(Field):
         Field.__init__(self, doc=doc, dtype=dtype, default=default,
                        check=None, optional=optional)
 
-        self.__doc__ += "\n\nAllowed values:\n\n"
+        docLines = [self.__doc__, "\n\nAllowed values:\n\n"]
         for choice, choiceDoc in self.allowed.items():
             if choice is not None and not isinstance(choice, dtype):
                 raise ValueError("ChoiceField's allowed choice %s is of incorrect type %s. Expected %s" %
                                  (choice, _typeStr(choice), _typeStr(dtype)))
-            self.__doc__ += "%s\n  %s\n" % ('``{0!r}``'.format(str(choice)), choiceDoc)
+            docLines.append("%s\n  %s\n" % ('``{0!r}``'.format(str(choice)), choiceDoc))
+        self.__doc__ = "".join(docLines)
 
         self.source = getStackFrame()
 
@@ -30,9 +30,10 @@ import copy
 import tempfile
 import shutil
 import warnings
+import functools
 
 from .comparison import getComparisonName, compareScalars, compareConfigs
-from .callStack import getStackFrame, getCallStack
+from .callStack import getStackFrame, getCallStack, _getEnvInt
 
 
 def _joinNamePath(prefix=None, name=None, index=None):
@@ -96,6 +97,55 @@ def _typeStr(x):
         return "%s.%s" % (xtype.__module__, xtype.__name__)
 
 
+_HISTORY_MAX = _getEnvInt("META_CONFIG_HISTORY_MAX", 1024)
+"""Maximum number of history entries kept per field.
+
+Read from the ``META_CONFIG_HISTORY_MAX`` environment variable; a value of
+zero or less keeps the complete history.
+"""
+
+
+def _appendHistory(history, entry):
+    """Append an entry to the history of a single field.
+
+    Parameters
+    ----------
+    history : `list`
+        The field's history.
+    entry : `tuple`
+        The ``(value, at, label)`` entry to record.
+
+    Notes
+    -----
+    Once the history holds more than ``_HISTORY_MAX`` entries the oldest one
+    is dropped.
+    """
+    history.append(entry)
+    if 0 < _HISTORY_MAX < len(history):
+        del history[0]
+
+
+@functools.lru_cache(maxsize=64)
+def _compileConfigFile(source, filename):
+    """Compile the contents of a configuration file, reusing the result for
+    identical contents.
+
+    Parameters
+    ----------
+    source : `str`
+        Contents of the configuration file.
+    filename : `str`
+        Name of the configuration file, as passed to
+        `lsst.pex.config.Config.load`.
+
+    Returns
+    -------
+    code : code object
+        The compiled contents of the file.
+    """
+    return compile(source, filename=filename, mode="exec")
+
+
 class ConfigMeta(type):
     """A metaclass for `lsst.pex.config.Config`.
 
@@ -105,11 +155,15 @@ class ConfigMeta(type):
     class attributes as a class attribute called ``_fields``, and adds
     the name of each field as an instance variable of the field itself (so you
     don't have to pass the name of the field to the field constructor).
+
+    The same fields are also kept in a `tuple` called ``_fieldTuple``, which
+    is cheaper to iterate on hot paths such as instance construction.
     """
 
     def __init__(cls, name, bases, dict_):
         type.__init__(cls, name, bases, dict_)
         cls._fields = {}
+        cls._fieldTuple = ()
         cls._source = getStackFrame()
 
         def getFields(classtype):
@@ -117,7 +171,11 @@ class ConfigMeta(type):
             bases = list(classtype.__bases__)
             bases.reverse()
             for b in bases:
-                fields.update(getFields(b))
+                if isinstance(b, ConfigMeta):
+                    # Config bases have already collected their fields.
+                    fields.update(b._fields)
+                else:
+                    fields.update(getFields(b))
 
             for k, v in classtype.__dict__.items():
                 if isinstance(v, Field):
@@ -126,12 +184,21 @@ class ConfigMeta(type):
 
         fields = getFields(cls)
         for k, v in fields.items():
-            setattr(cls, k, copy.deepcopy(v))
+            v = copy.deepcopy(v)
+            v.name = k
+            cls._fields[k] = v
+            type.__setattr__(cls, k, v)
+        # Build the tuple once rather than once per field in __setattr__.
+        type.__setattr__(cls, "_fieldTuple", tuple(cls._fields.values()))
 
     def __setattr__(cls, name, value):
         if isinstance(value, Field):
+            # Names from setattr() with a computed string are not interned
+            # automatically; they key _storage and _history on every access.
+            name = sys.intern(name)
             value.name = name
             cls._fields[name] = value
+            type.__setattr__(cls, "_fieldTuple", tuple(cls._fields.values()))
         type.__setattr__(cls, name, value)
 
 
@@ -168,7 +235,10 @@ class FieldValidationError(ValueError):
         (`str`).
         """
 
-        self.history = config.history.setdefault(field.name, [])
+        history = config.history.get(field.name)
+        if history is None:
+            history = config.history[field.name] = []
+        self.history = history
         """Full history of all changes to the `~lsst.pex.config.Field`
         instance.
         """
@@ -364,8 +434,7 @@ class Field:
         `lsst.pex.config.field.Field.validate` if they re-implement
         `~lsst.pex.config.field.Field.validate`.
         """
-        value = self.__get__(instance)
-        if not self.optional and value is None:
+        if not self.optional and instance._storage[self.name] is None:
             raise FieldValidationError(self, instance, "Required value cannot be None")
 
     def freeze(self, instance):
@@ -404,11 +473,14 @@ class Field:
         if value is None:
             return
 
-        if not isinstance(value, self.dtype):
+        dtype = self.dtype
+        # An exact type match is the common case and avoids isinstance.
+        if value.__class__ is not dtype and not isinstance(value, dtype):
             msg = "Value %s is of incorrect type %s. Expected type %s" % \
-                (value, _typeStr(value), _typeStr(self.dtype))
+                (value, _typeStr(value), _typeStr(dtype))
             raise TypeError(msg)
-        if self.check is not None and not self.check(value):
+        check = self.check
+        if check is not None and not check(value):
             msg = "Value %s is not a valid value" % str(value)
             raise ValueError(msg)
 
@@ -447,7 +519,7 @@ class Field:
 
         This output can be executed with Python.
         """
-        value = self.__get__(instance)
+        value = instance._storage[self.name]
         fullname = _joinNamePath(instance._name, self.name)
 
         # write full documentation string as comment lines (i.e. first character is #)
@@ -483,7 +555,7 @@ class Field:
         where the keys are the field names in the subconfig, and the values are
         the field values in the subconfig.
         """
-        return self.__get__(instance)
+        return instance._storage[self.name]
 
     def __get__(self, instance, owner=None, at=None, label="default"):
         """Define how attribute access should occur on the Config instance
@@ -547,7 +619,9 @@ class Field:
         if instance._frozen:
             raise FieldValidationError(self, instance, "Cannot modify a frozen Config")
 
-        history = instance._history.setdefault(self.name, [])
+        history = instance._history.get(self.name)
+        if history is None:
+            history = instance._history[self.name] = []
         if value is not None:
             value = _autocast(value, self.dtype)
             try:
@@ -558,7 +632,7 @@ class Field:
         instance._storage[self.name] = value
         if at is None:
             at = getCallStack()
-        history.append((value, at, label))
+        _appendHistory(history, (value, at, label))
 
     def __delete__(self, instance, at=None, label='deletion'):
         """Delete an attribute from a `lsst.pex.config.Config` instance.
@@ -796,7 +870,7 @@ class Config(metaclass=ConfigMeta):
         --------
         lsst.pex.config.Config.values
         """
-        return iter(self.storage.values())
+        return iter(self._storage.values())
 
     def iterkeys(self):
         """Iterate over field names
@@ -810,7 +884,7 @@ class Config(metaclass=ConfigMeta):
         --------
         lsst.pex.config.Config.values
         """
-        return iter(self.storage.keys())
+        return iter(self._storage.keys())
 
     def __contains__(self, name):
         """!Return True if the specified field exists in this config
@@ -832,7 +906,9 @@ class Config(metaclass=ConfigMeta):
         when or even the base ``Config.__init__`` should be called.
         """
         name = kw.pop("__name", None)
-        at = kw.pop("__at", getCallStack())
+        at = kw.pop("__at", None)
+        if at is None:
+            at = getCallStack()
         # remove __label and ignore it
         kw.pop("__label", "default")
 
@@ -840,11 +916,11 @@ class Config(metaclass=ConfigMeta):
         instance._frozen = False
         instance._name = name
         instance._storage = {}
-        instance._history = {}
+        fieldTuple = instance._fieldTuple
+        instance._history = {field.name: [] for field in fieldTuple}
         instance._imports = set()
         # load up defaults
-        for field in instance._fields.values():
-            instance._history[field.name] = []
+        for field in fieldTuple:
             field.__set__(instance, field.default, at=at + [field.source], label="default")
         # set custom default-overides
         instance.setDefaults()
@@ -927,15 +1003,17 @@ class Config(metaclass=ConfigMeta):
         fieldB: True
         fieldC: 'Updated!'
         """
-        at = kw.pop("__at", getCallStack())
+        at = kw.pop("__at", None)
+        if at is None:
+            at = getCallStack()
         label = kw.pop("__label", "update")
 
+        fields = self._fields
         for name, value in kw.items():
-            try:
-                field = self._fields[name]
-                field.__set__(self, value, at=at, label=label)
-            except KeyError:
+            field = fields.get(name)
+            if field is None:
                 raise KeyError("No field of name %s exists in config type %s" % (name, _typeStr(self)))
+            field.__set__(self, value, at=at, label=label)
 
     def load(self, filename, root="config"):
         """Modify this config in place by executing the Python code in a
@@ -969,8 +1047,8 @@ class Config(metaclass=ConfigMeta):
         lsst.pex.config.Config.saveFromStream
         """
         with open(filename, "r") as f:
-            code = compile(f.read(), filename=filename, mode="exec")
-            self.loadFromStream(stream=code, root=root)
+            code = _compileConfigFile(f.read(), filename)
+        self.loadFromStream(stream=code, root=root)
 
     def loadFromStream(self, stream, root="config", filename=None):
         """Modify this Config in place by executing the Python code in the
@@ -1079,29 +1157,33 @@ class Config(metaclass=ConfigMeta):
         """
         tmp = self._name
         self._rename(root)
+        # Fields write many short lines; collect them in memory and hand the
+        # result to the destination stream in a single write.
+        buffer = io.StringIO()
         try:
             self._collectImports()
             # Remove self from the set, as it is handled explicitly below
             self._imports.remove(self.__module__)
             configType = type(self)
             typeString = _typeStr(configType)
-            outfile.write(u"import {}\n".format(configType.__module__))
-            outfile.write(u"assert type({})=={}, 'config is of type %s.%s ".format(root, typeString))
-            outfile.write(u"instead of {}' % (type({}).__module__, type({}).__name__)\n".format(typeString,
-                                                                                                root,
-                                                                                                root))
+            buffer.write(u"import {}\n".format(configType.__module__))
+            buffer.write(u"assert type({})=={}, 'config is of type %s.%s ".format(root, typeString))
+            buffer.write(u"instead of {}' % (type({}).__module__, type({}).__name__)\n".format(typeString,
+                                                                                               root,
+                                                                                               root))
             for imp in self._imports:
                 if imp in sys.modules and sys.modules[imp] is not None:
-                    outfile.write(u"import {}\n".format(imp))
-            self._save(outfile)
+                    buffer.write(u"import {}\n".format(imp))
+            self._save(buffer)
         finally:
             self._rename(tmp)
+        outfile.write(buffer.getvalue())
 
     def freeze(self):
         """Make this config, and all subconfigs, read-only.
         """
         self._frozen = True
-        for field in self._fields.values():
+        for field in self._fieldTuple:
             field.freeze(self)
 
     def _save(self, outfile):
@@ -1113,7 +1195,7 @@ class Config(metaclass=ConfigMeta):
             Destination file object write the config into. Accepts strings not
             bytes.
         """
-        for field in self._fields.values():
+        for field in self._fieldTuple:
             field.save(outfile, self)
 
     def _collectImports(self):
@@ -1124,7 +1206,7 @@ class Config(metaclass=ConfigMeta):
         will be merged with the set of imports for this config class.
         """
         self._imports.add(self.__module__)
-        for name, field in self._fields.items():
+        for field in self._fieldTuple:
             field._collectImports(self, self._imports)
 
     def toDict(self):
@@ -1146,10 +1228,7 @@ class Config(metaclass=ConfigMeta):
         individual fields. Subclasses of `~lsst.pex.config.Field` may need to
         implement a ``toDict`` method for *this* method to work.
         """
-        dict_ = {}
-        for name, field in self._fields.items():
-            dict_[name] = field.toDict(self)
-        return dict_
+        return {field.name: field.toDict(self) for field in self._fieldTuple}
 
     def names(self):
         """Get all the field names in the config, recursively.
@@ -1201,7 +1280,7 @@ class Config(metaclass=ConfigMeta):
         lsst.pex.config.Field.rename
         """
         self._name = name
-        for field in self._fields.values():
+        for field in self._fieldTuple:
             field.rename(self)
 
     def validate(self):
@@ -1227,7 +1306,7 @@ class Config(metaclass=ConfigMeta):
         `~lsst.pex.config.Config` classes after calling this method, and base
         validation is complete.
         """
-        for field in self._fields.values():
+        for field in self._fieldTuple:
             field.validate(self)
 
     def formatHistory(self, name, **kwargs):
@@ -1269,36 +1348,40 @@ class Config(metaclass=ConfigMeta):
         users from accidentally mispelling a field name, or trying to set a
         non-existent field.
         """
-        if attr in self._fields:
-            if self._fields[attr].deprecated is not None:
-                fullname = _joinNamePath(self._name, self._fields[attr].name)
-                warnings.warn(f"Config field {fullname} is deprecated: {self._fields[attr].deprecated}",
+        field = self._fields.get(attr)
+        if field is not None:
+            if field.deprecated is not None:
+                fullname = _joinNamePath(self._name, field.name)
+                warnings.warn(f"Config field {fullname} is deprecated: {field.deprecated}",
                               FutureWarning)
             if at is None:
                 at = getCallStack()
             # This allows Field descriptors to work.
-            self._fields[attr].__set__(self, value, at=at, label=label)
+            field.__set__(self, value, at=at, label=label)
+        elif attr in self.__dict__ or attr in ("_name", "_history", "_storage", "_frozen", "_imports"):
+            # This allows specific private attributes to work. Checked before
+            # probing the class for descriptors because it is the common case.
+            self.__dict__[attr] = value
         elif hasattr(getattr(self.__class__, attr, None), '__set__'):
             # This allows properties and other non-Field descriptors to work.
             return object.__setattr__(self, attr, value)
-        elif attr in self.__dict__ or attr in ("_name", "_history", "_storage", "_frozen", "_imports"):
-            # This allows specific private attributes to work.
-            self.__dict__[attr] = value
         else:
             # We throw everything else.
             raise AttributeError("%s has no attribute %s" % (_typeStr(self), attr))
 
     def __delattr__(self, attr, at=None, label="deletion"):
-        if attr in self._fields:
+        field = self._fields.get(attr)
+        if field is not None:
             if at is None:
                 at = getCallStack()
-            self._fields[attr].__delete__(self, at=at, label=label)
+            field.__delete__(self, at=at, label=label)
         else:
             object.__delattr__(self, attr)
 
     def __eq__(self, other):
         if type(other) == type(self):
-            for name in self._fields:
+            for field in self._fieldTuple:
+                name = field.name
                 thisValue = getattr(self, name)
                 otherValue = getattr(other, name)
                 if isinstance(thisValue, float) and math.isnan(thisValue):
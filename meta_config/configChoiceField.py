@@ -25,7 +25,7 @@ __all__ = ["ConfigChoiceField"]
 import copy
 import collections.abc
 
-from .config import Config, Field, FieldValidationError, _typeStr, _joinNamePath
+from .config import Config, Field, FieldValidationError, _typeStr, _joinNamePath, _appendHistory
 from .comparison import getComparisonName, compareScalars, compareConfigs
 from .callStack import getCallStack, getStackFrame
 
@@ -55,28 +55,36 @@ class SelectionSet(collections.abc.MutableSet):
     history.
     """
 
+    __slots__ = ("_dict", "_field", "_config", "__history", "_set")
+
     def __init__(self, dict_, value, at=None, label="assignment", setHistory=True):
         if at is None:
             at = getCallStack()
         self._dict = dict_
         self._field = self._dict._field
         self._config = self._dict._config
-        self.__history = self._config._history.setdefault(self._field.name, [])
+        history = self._config._history.get(self._field.name)
+        if history is None:
+            history = self._config._history[self._field.name] = []
+        self.__history = history
         if value is not None:
+            types = self._field.typemap
             try:
+                # materialize once so generators are not exhausted by the check
+                value = tuple(value)
                 for v in value:
-                    if v not in self._dict:
+                    if v not in types:
                         # invoke __getitem__ to ensure it's present
                         self._dict.__getitem__(v, at=at)
             except TypeError:
-                msg = "Value %s is of incorrect type %s. Sequence type expected"(value, _typeStr(value))
+                msg = "Value %s is of incorrect type %s. Sequence type expected" % (value, _typeStr(value))
                 raise FieldValidationError(self._field, self._config, msg)
             self._set = set(value)
         else:
             self._set = set()
 
         if setHistory:
-            self.__history.append(("Set selection to %s" % self, at, label))
+            _appendHistory(self.__history, ("Set selection to %s" % self, at, label))
 
     def add(self, value, at=None):
         """Add a value to the selected set.
@@ -88,11 +96,11 @@ class SelectionSet(collections.abc.MutableSet):
         if at is None:
             at = getCallStack()
 
-        if value not in self._dict:
+        if value not in self._field.typemap:
             # invoke __getitem__ to make sure it's present
             self._dict.__getitem__(value, at=at)
 
-        self.__history.append(("added %s to selection" % value, at, "selection"))
+        _appendHistory(self.__history, ("added %s to selection" % value, at, "selection"))
         self._set.add(value)
 
     def discard(self, value, at=None):
@@ -102,13 +110,13 @@ class SelectionSet(collections.abc.MutableSet):
             raise FieldValidationError(self._field, self._config,
                                        "Cannot modify a frozen Config")
 
-        if value not in self._dict:
+        if value not in self._field.typemap:
             return
 
         if at is None:
             at = getCallStack()
 
-        self.__history.append(("removed %s from selection" % value, at, "selection"))
+        _appendHistory(self.__history, ("removed %s from selection" % value, at, "selection"))
         self._set.discard(value)
 
     def __len__(self):
@@ -146,7 +154,10 @@ class ConfigInstanceDict(collections.abc.Mapping):
         self._selection = None
         self._config = config
         self._field = field
-        self._history = config._history.setdefault(field.name, [])
+        history = config._history.get(field.name)
+        if history is None:
+            history = config._history[field.name] = []
+        self._history = history
         self.__doc__ = field.doc
 
     types = property(lambda x: x._field.typemap)
@@ -170,12 +181,12 @@ class ConfigInstanceDict(collections.abc.Mapping):
         if value is None:
             self._selection = None
         elif self._field.multi:
-            self._selection = SelectionSet(self, value, setHistory=False)
+            self._selection = SelectionSet(self, value, at=at, label=label, setHistory=False)
         else:
             if value not in self._dict:
                 self.__getitem__(value, at=at)  # just invoke __getitem__ to make sure it's present
             self._selection = value
-        self._history.append((value, at, label))
+        _appendHistory(self._history, (value, at, label))
 
     def _getNames(self):
         if not self._field.multi:
@@ -226,13 +237,15 @@ class ConfigInstanceDict(collections.abc.Mapping):
     """
 
     def _getActive(self):
-        if self._selection is None:
+        selection = self._selection
+        if selection is None:
             return None
 
-        if self._field.multi:
-            return [self[c] for c in self._selection]
-        else:
-            return self[self._selection]
+        if not self._field.multi:
+            value = self._dict.get(selection)
+            return value if value is not None else self[selection]
+
+        return [self[c] for c in selection]
 
     active = property(_getActive)
     """The selected items.
@@ -242,20 +255,19 @@ class ConfigInstanceDict(collections.abc.Mapping):
     """
 
     def __getitem__(self, k, at=None, label="default"):
+        value = self._dict.get(k)
+        if value is not None:
+            return value
         try:
-            value = self._dict[k]
-        except KeyError:
-            try:
-                dtype = self._field.typemap[k]
-            except Exception:
-                raise FieldValidationError(self._field, self._config,
-                                           "Unknown key %r in Registry/ConfigChoiceField" % k)
-            name = _joinNamePath(self._config._name, self._field.name, k)
-            if at is None:
-                at = getCallStack()
-                at.insert(0, dtype._source)
-            value = self._dict.setdefault(k, dtype(__name=name, __at=at, __label=label))
-        return value
+            dtype = self._field.typemap[k]
+        except Exception:
+            raise FieldValidationError(self._field, self._config,
+                                       "Unknown key %r in Registry/ConfigChoiceField" % k)
+        name = _joinNamePath(self._config._name, self._field.name, k)
+        if at is None:
+            at = getCallStack()
+            at.insert(0, dtype._source)
+        return self._dict.setdefault(k, dtype(__name=name, __at=at, __label=label))
 
     def __setitem__(self, k, value, at=None, label="assignment"):
         if self._config._frozen:
@@ -266,22 +278,22 @@ class ConfigInstanceDict(collections.abc.Mapping):
         except Exception:
             raise FieldValidationError(self._field, self._config, "Unknown key %r" % k)
 
-        if value != dtype and type(value) != dtype:
+        if value is not dtype and value.__class__ is not dtype:
             msg = "Value %s at key %k is of incorrect type %s. Expected type %s" % \
                 (value, k, _typeStr(value), _typeStr(dtype))
             raise FieldValidationError(self._field, self._config, msg)
 
         if at is None:
             at = getCallStack()
-        name = _joinNamePath(self._config._name, self._field.name, k)
-        oldValue = self._dict.get(k, None)
+        oldValue = self._dict.get(k)
         if oldValue is None:
-            if value == dtype:
+            name = _joinNamePath(self._config._name, self._field.name, k)
+            if value is dtype:
                 self._dict[k] = value(__name=name, __at=at, __label=label)
             else:
                 self._dict[k] = dtype(__name=name, __at=at, __label=label, **value._storage)
         else:
-            if value == dtype:
+            if value is dtype:
                 value = value()
             oldValue.update(__at=at, __label=label, **value._storage)
 
@@ -290,12 +302,13 @@ class ConfigInstanceDict(collections.abc.Mapping):
             v._rename(_joinNamePath(name=fullname, index=k))
 
     def __setattr__(self, attr, value, at=None, label="assignment"):
-        if hasattr(getattr(self.__class__, attr, None), '__set__'):
-            # This allows properties to work.
+        if attr in self.__dict__ or attr in ("_history", "_field", "_config", "_dict",
+                                             "_selection", "__doc__"):
+            # This allows specific private attributes to work. Checked first
+            # because it is the common case and avoids probing the class.
             object.__setattr__(self, attr, value)
-        elif attr in self.__dict__ or attr in ["_history", "_field", "_config", "_dict",
-                                               "_selection", "__doc__"]:
-            # This allows specific private attributes to work.
+        elif hasattr(getattr(self.__class__, attr, None), '__set__'):
+            # This allows properties to work.
             object.__setattr__(self, attr, value)
         else:
             # We throw everything else.
@@ -417,14 +430,17 @@ class ConfigChoiceField(Field):
         self.multi = multi
 
     def _getOrMake(self, instance, label="default"):
-        instanceDict = instance._storage.get(self.name)
+        storage = instance._storage
+        instanceDict = storage.get(self.name)
         if instanceDict is None:
             at = getCallStack(1)
             instanceDict = self.dtype(instance, self)
             instanceDict.__doc__ = self.doc
-            instance._storage[self.name] = instanceDict
-            history = instance._history.setdefault(self.name, [])
-            history.append(("Initialized from defaults", at, label))
+            storage[self.name] = instanceDict
+            history = instance._history.get(self.name)
+            if history is None:
+                history = instance._history[self.name] = []
+            _appendHistory(history, ("Initialized from defaults", at, label))
 
         return instanceDict
 
@@ -455,15 +471,16 @@ class ConfigChoiceField(Field):
 
     def validate(self, instance):
         instanceDict = self.__get__(instance)
-        if instanceDict.active is None and not self.optional:
+        active = instanceDict.active
+        if active is None and not self.optional:
             msg = "Required field cannot be None"
             raise FieldValidationError(self, instance, msg)
-        elif instanceDict.active is not None:
+        elif active is not None:
             if self.multi:
-                for a in instanceDict.active:
+                for a in active:
                     a.validate()
             else:
-                instanceDict.active.validate()
+                active.validate()
 
     def toDict(self, instance):
         instanceDict = self.__get__(instance)
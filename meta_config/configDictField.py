@@ -20,7 +20,7 @@
 # see <http://www.lsstcorp.org/LegalNotices/>.
 #
 
-from .config import Config, FieldValidationError, _autocast, _typeStr, _joinNamePath
+from .config import Config, FieldValidationError, _autocast, _typeStr, _joinNamePath, _appendHistory
 from .dictField import Dict, DictField
 from .comparison import compareConfigs, compareScalars, getComparisonName
 from .callStack import getCallStack, getStackFrame
@@ -37,7 +37,7 @@ class ConfigDict(Dict):
 
     def __init__(self, config, field, value, at, label):
         Dict.__init__(self, config, field, value, at, label, setHistory=False)
-        self.history.append(("Dict initialized", at, label))
+        _appendHistory(self.history, ("Dict initialized", at, label))
 
     def __setitem__(self, k, x, at=None, label="setitem", setHistory=True):
         if self._config._frozen:
@@ -54,34 +54,34 @@ class ConfigDict(Dict):
 
         # validate itemtype
         dtype = self._field.itemtype
-        if type(x) != self._field.itemtype and x != self._field.itemtype:
+        if x.__class__ is not dtype and x is not dtype:
             msg = "Value %s at key %r is of incorrect type %s. Expected type %s" % \
-                (x, k, _typeStr(x), _typeStr(self._field.itemtype))
+                (x, k, _typeStr(x), _typeStr(dtype))
             raise FieldValidationError(self._field, self._config, msg)
 
         if at is None:
             at = getCallStack()
-        name = _joinNamePath(self._config._name, self._field.name, k)
         oldValue = self._dict.get(k, None)
         if oldValue is None:
-            if x == dtype:
+            name = _joinNamePath(self._config._name, self._field.name, k)
+            if x is dtype:
                 self._dict[k] = dtype(__name=name, __at=at, __label=label)
             else:
                 self._dict[k] = dtype(__name=name, __at=at, __label=label, **x._storage)
             if setHistory:
-                self.history.append(("Added item at key %s" % k, at, label))
+                _appendHistory(self.history, ("Added item at key %s" % k, at, label))
         else:
-            if x == dtype:
+            if x is dtype:
                 x = dtype()
             oldValue.update(__at=at, __label=label, **x._storage)
             if setHistory:
-                self.history.append(("Modified item at key %s" % k, at, label))
+                _appendHistory(self.history, ("Modified item at key %s" % k, at, label))
 
     def __delitem__(self, k, at=None, label="delitem"):
         if at is None:
             at = getCallStack()
         Dict.__delitem__(self, k, at, label, False)
-        self.history.append(("Removed item at key %s" % k, at, label))
+        _appendHistory(self.history, ("Removed item at key %s" % k, at, label))
 
 
 class ConfigDictField(DictField):
@@ -22,7 +22,7 @@
 
 __all__ = ["ConfigField"]
 
-from .config import Config, Field, FieldValidationError, _joinNamePath, _typeStr
+from .config import Config, Field, FieldValidationError, _joinNamePath, _typeStr, _appendHistory
 from .comparison import compareConfigs, getComparisonName
 from .callStack import getCallStack, getStackFrame
 
@@ -100,7 +100,7 @@ class ConfigField(Field):
                                        "Cannot modify a frozen Config")
         name = _joinNamePath(prefix=instance._name, name=self.name)
 
-        if value != self.dtype and type(value) != self.dtype:
+        if value is not self.dtype and value.__class__ is not self.dtype:
             msg = "Value %s is of incorrect type %s. Expected %s" % \
                 (value, _typeStr(value), _typeStr(self.dtype))
             raise FieldValidationError(self, instance, msg)
@@ -109,18 +109,24 @@ class ConfigField(Field):
             at = getCallStack()
 
         oldValue = instance._storage.get(self.name, None)
-        if oldValue is None:
-            if value == self.dtype:
+        if value is oldValue:
+            # Re-assigning the stored subconfig to itself would only copy
+            # every field onto itself.
+            pass
+        elif oldValue is None:
+            if value is self.dtype:
                 instance._storage[self.name] = self.dtype(__name=name, __at=at, __label=label)
             else:
                 instance._storage[self.name] = self.dtype(__name=name, __at=at,
                                                           __label=label, **value._storage)
         else:
-            if value == self.dtype:
+            if value is self.dtype:
                 value = value()
             oldValue.update(__at=at, __label=label, **value._storage)
-        history = instance._history.setdefault(self.name, [])
-        history.append(("config value set", at, label))
+        history = instance._history.get(self.name)
+        if history is None:
+            history = instance._history[self.name] = []
+        _appendHistory(history, ("config value set", at, label))
 
     def rename(self, instance):
         """Rename the field in a `~lsst.pex.config.Config` (for internal use
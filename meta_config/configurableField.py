@@ -23,7 +23,7 @@ __all__ = ('ConfigurableInstance', 'ConfigurableField')
 
 import copy
 
-from .config import Config, Field, _joinNamePath, _typeStr, FieldValidationError
+from .config import Config, Field, _joinNamePath, _typeStr, FieldValidationError, _appendHistory
 from .comparison import compareConfigs, getComparisonName
 from .callStack import getCallStack, getStackFrame
 
@@ -74,8 +74,10 @@ class ConfigurableInstance:
         at += [self._field.source]
         self.__initValue(at, label)
 
-        history = config._history.setdefault(field.name, [])
-        history.append(("Targeted and initialized from defaults", at, label))
+        history = config._history.get(field.name)
+        if history is None:
+            history = config._history[field.name] = []
+        _appendHistory(history, ("Targeted and initialized from defaults", at, label))
 
     target = property(lambda x: x._target)
     """The targeted configurable (read-only).
@@ -119,9 +121,11 @@ class ConfigurableInstance:
             object.__setattr__(self, "_ConfigClass", ConfigClass)
             self.__initValue(at, label)
 
-        history = self._config._history.setdefault(self._field.name, [])
+        history = self._config._history.get(self._field.name)
+        if history is None:
+            history = self._config._history[self._field.name] = []
         msg = "retarget(target=%s, ConfigClass=%s)" % (_typeStr(target), _typeStr(ConfigClass))
-        history.append((msg, at, label))
+        _appendHistory(history, (msg, at, label))
 
     def __getattr__(self, name):
         return getattr(self._value, name)
@@ -266,12 +270,13 @@ class ConfigurableField(Field):
         self.ConfigClass = ConfigClass
 
     def __getOrMake(self, instance, at=None, label="default"):
-        value = instance._storage.get(self.name, None)
+        storage = instance._storage
+        value = storage.get(self.name)
         if value is None:
             if at is None:
                 at = getCallStack(1)
             value = ConfigurableInstance(instance, self, at=at, label=label)
-            instance._storage[self.name] = value
+            storage[self.name] = value
         return value
 
     def __get__(self, instance, owner=None, at=None, label="default"):
@@ -290,9 +295,9 @@ class ConfigurableField(Field):
         if isinstance(value, ConfigurableInstance):
             oldValue.retarget(value.target, value.ConfigClass, at, label)
             oldValue.update(__at=at, __label=label, **value._storage)
-        elif type(value) == oldValue._ConfigClass:
+        elif value.__class__ is oldValue._ConfigClass:
             oldValue.update(__at=at, __label=label, **value._storage)
-        elif value == oldValue.ConfigClass:
+        elif value is oldValue.ConfigClass:
             value = oldValue.ConfigClass()
             oldValue.update(__at=at, __label=label, **value._storage)
         else:
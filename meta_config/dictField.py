@@ -24,7 +24,8 @@ __all__ = ["DictField"]
 
 import collections.abc
 
-from .config import Field, FieldValidationError, _typeStr, _autocast, _joinNamePath
+from .config import (Field, FieldValidationError, _typeStr, _autocast, _joinNamePath,
+                     _appendHistory)
 from .comparison import getComparisonName, compareScalars
 from .callStack import getCallStack, getStackFrame
 
@@ -39,7 +40,10 @@ class Dict(collections.abc.MutableMapping):
         self._field = field
         self._config = config
         self._dict = {}
-        self._history = self._config._history.setdefault(self._field.name, [])
+        history = self._config._history.get(self._field.name)
+        if history is None:
+            history = self._config._history[self._field.name] = []
+        self._history = history
         self.__doc__ = field.doc
         if value is not None:
             try:
@@ -51,7 +55,7 @@ class Dict(collections.abc.MutableMapping):
                     (value, _typeStr(value))
                 raise FieldValidationError(self._field, self._config, msg)
         if setHistory:
-            self._history.append((dict(self._dict), at, label))
+            _appendHistory(self._history, (dict(self._dict), at, label))
 
     history = property(lambda x: x._history)
     """History (read-only).
@@ -104,7 +108,7 @@ class Dict(collections.abc.MutableMapping):
 
         self._dict[k] = x
         if setHistory:
-            self._history.append((dict(self._dict), at, label))
+            _appendHistory(self._history, (dict(self._dict), at, label))
 
     def __delitem__(self, k, at=None, label="delitem", setHistory=True):
         if self._config._frozen:
@@ -115,7 +119,7 @@ class Dict(collections.abc.MutableMapping):
         if setHistory:
             if at is None:
                 at = getCallStack()
-            self._history.append((dict(self._dict), at, label))
+            _appendHistory(self._history, (dict(self._dict), at, label))
 
     def __repr__(self):
         return repr(self._dict)
@@ -124,11 +128,12 @@ class Dict(collections.abc.MutableMapping):
         return str(self._dict)
 
     def __setattr__(self, attr, value, at=None, label="assignment"):
-        if hasattr(getattr(self.__class__, attr, None), '__set__'):
-            # This allows properties to work.
+        if attr in self.__dict__ or attr in ("_field", "_config", "_history", "_dict", "__doc__"):
+            # This allows specific private attributes to work. Checked first
+            # because it is the common case and avoids probing the class.
             object.__setattr__(self, attr, value)
-        elif attr in self.__dict__ or attr in ["_field", "_config", "_history", "_dict", "__doc__"]:
-            # This allows specific private attributes to work.
+        elif hasattr(getattr(self.__class__, attr, None), '__set__'):
+            # This allows properties to work.
             object.__setattr__(self, attr, value)
         else:
             # We throw everything else.
@@ -244,7 +249,7 @@ class DictField(Field):
         checks are not repeated by this method.
         """
         Field.validate(self, instance)
-        value = self.__get__(instance)
+        value = instance._storage[self.name]
         if value is not None and self.dictCheck is not None \
                 and not self.dictCheck(value):
             msg = "%s is not a valid value" % str(value)
@@ -261,8 +266,10 @@ class DictField(Field):
         if value is not None:
             value = self.DictClass(instance, self, value, at=at, label=label)
         else:
-            history = instance._history.setdefault(self.name, [])
-            history.append((value, at, label))
+            history = instance._history.get(self.name)
+            if history is None:
+                history = instance._history[self.name] = []
+            _appendHistory(history, (value, at, label))
 
         instance._storage[self.name] = value
 
@@ -217,7 +217,7 @@ def format(config, name=None, writeSourceLine=True, prefix="", verbose=False):
     if writeSourceLine:
         sourceLengths = []
         for value, output in outputs:
-            sourceLengths.append(max([len(x[0][0]) for x in output]))
+            sourceLengths.append(max([len(x[0][0]) for x in output], default=0))
         sourceLength = max(sourceLengths)
 
     valueLength = len(prefix) + max([len(str(value)) for value, output in outputs])
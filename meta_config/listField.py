@@ -24,7 +24,8 @@ __all__ = ["ListField"]
 
 import collections.abc
 
-from .config import Field, FieldValidationError, _typeStr, _autocast, _joinNamePath
+from .config import (Field, FieldValidationError, _typeStr, _autocast, _joinNamePath,
+                     _appendHistory)
 from .comparison import compareScalars, getComparisonName
 from .callStack import getCallStack, getStackFrame
 
@@ -59,18 +60,31 @@ class List(collections.abc.MutableSequence):
     def __init__(self, config, field, value, at, label, setHistory=True):
         self._field = field
         self._config = config
-        self._history = self._config._history.setdefault(self._field.name, [])
+        history = self._config._history.get(self._field.name)
+        if history is None:
+            history = self._config._history[self._field.name] = []
+        self._history = history
         self._list = []
         self.__doc__ = field.doc
         if value is not None:
+            # Coerce and validate the whole sequence in one pass rather than
+            # inserting it into the list one item at a time.
+            itemtype = field.itemtype
             try:
-                for i, x in enumerate(value):
-                    self.insert(i, x, setHistory=False)
+                items = list(value)
+                # Items that are exactly of the item type need neither a cast
+                # nor a type check; with no itemCheck there is nothing to do.
+                if field.itemCheck is not None or not all(x.__class__ is itemtype for x in items):
+                    for i, x in enumerate(items):
+                        x = _autocast(x, itemtype)
+                        self.validateItem(i, x)
+                        items[i] = x
             except TypeError:
                 msg = "Value %s is of incorrect type %s. Sequence type expected" % (value, _typeStr(value))
                 raise FieldValidationError(self._field, self._config, msg)
+            self._list = items
         if setHistory:
-            self.history.append((list(self._list), at, label))
+            _appendHistory(self.history, (list(self._list), at, label))
 
     def validateItem(self, i, x):
         """Validate an item to determine if it can be included in the list.
@@ -133,7 +147,7 @@ class List(collections.abc.MutableSequence):
         if setHistory:
             if at is None:
                 at = getCallStack()
-            self.history.append((list(self._list), at, label))
+            _appendHistory(self.history, (list(self._list), at, label))
 
     def __getitem__(self, i):
         return self._list[i]
@@ -146,7 +160,7 @@ class List(collections.abc.MutableSequence):
         if setHistory:
             if at is None:
                 at = getCallStack()
-            self.history.append((list(self._list), at, label))
+            _appendHistory(self.history, (list(self._list), at, label))
 
     def __iter__(self):
         return iter(self._list)
@@ -169,9 +183,17 @@ class List(collections.abc.MutableSequence):
             Enable setting the field's history, using the value of the ``at``
             parameter. Default is `True`.
         """
-        if at is None:
-            at = getCallStack()
-        self.__setitem__(slice(i, i), [x], at=at, label=label, setHistory=setHistory)
+        if self._config._frozen:
+            raise FieldValidationError(self._field, self._config,
+                                       "Cannot modify a frozen Config")
+        # Insert directly rather than through a one-item slice assignment.
+        x = _autocast(x, self._field.itemtype)
+        self.validateItem(i, x)
+        self._list.insert(i, x)
+        if setHistory:
+            if at is None:
+                at = getCallStack()
+            _appendHistory(self.history, (list(self._list), at, label))
 
     def __repr__(self):
         return repr(self._list)
@@ -196,11 +218,12 @@ class List(collections.abc.MutableSequence):
         return not self.__eq__(other)
 
     def __setattr__(self, attr, value, at=None, label="assignment"):
-        if hasattr(getattr(self.__class__, attr, None), '__set__'):
-            # This allows properties to work.
+        if attr in self.__dict__ or attr in ("_field", "_config", "_history", "_list", "__doc__"):
+            # This allows specific private attributes to work. Checked first
+            # because it is the common case and avoids probing the class.
             object.__setattr__(self, attr, value)
-        elif attr in self.__dict__ or attr in ["_field", "_config", "_history", "_list", "__doc__"]:
-            # This allows specific private attributes to work.
+        elif hasattr(getattr(self.__class__, attr, None), '__set__'):
+            # This allows properties to work.
             object.__setattr__(self, attr, value)
         else:
             # We throw everything else.
@@ -332,7 +355,7 @@ class ListField(Field):
         set and are not re-checked by this method.
         """
         Field.validate(self, instance)
-        value = self.__get__(instance)
+        value = instance._storage[self.name]
         if value is not None:
             lenValue = len(value)
             if self.length is not None and not lenValue == self.length:
@@ -358,8 +381,10 @@ class ListField(Field):
         if value is not None:
             value = List(instance, self, value, at, label)
         else:
-            history = instance._history.setdefault(self.name, [])
-            history.append((value, at, label))
+            history = instance._history.get(self.name)
+            if history is None:
+                history = instance._history[self.name] = []
+            _appendHistory(history, (value, at, label))
 
         instance._storage[self.name] = value
 
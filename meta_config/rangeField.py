@@ -19,6 +19,8 @@
 # the GNU General Public License along with this program.  If not,
 # see <http://www.lsstcorp.org/LegalNotices/>.
 #
+import operator
+
 from .config import Field, _typeStr
 from .callStack import getStackFrame
 
@@ -93,21 +95,31 @@ class RangeField(Field):
         self.min = min
         """Minimum value accepted in the range. If `None`, the range has no
         lower bound (equivalent to negative infinity).
+
+        The bound used for validation is fixed when the field is constructed;
+        assigning to this attribute afterwards does not change it.
         """
 
         self.max = max
         """Maximum value accepted in the range. If `None`, the range has no
         upper bound (equivalent to positive infinity).
+
+        The bound used for validation is fixed when the field is constructed;
+        assigning to this attribute afterwards does not change it.
         """
 
-        if inclusiveMax:
-            self.maxCheck = lambda x, y: True if y is None else x <= y
-        else:
-            self.maxCheck = lambda x, y: True if y is None else x < y
-        if inclusiveMin:
-            self.minCheck = lambda x, y: True if y is None else x >= y
+        # Resolve which bounds exist and how they compare once, so that
+        # validating a value is a single call with no None checks.
+        lower = operator.ge if inclusiveMin else operator.gt
+        upper = operator.le if inclusiveMax else operator.lt
+        self.maxCheck = lambda x, y: True if y is None else upper(x, y)
+        self.minCheck = lambda x, y: True if y is None else lower(x, y)
+        if min is None:
+            self._rangeCheck = lambda x: upper(x, max)
+        elif max is None:
+            self._rangeCheck = lambda x: lower(x, min)
         else:
-            self.minCheck = lambda x, y: True if y is None else x > y
+            self._rangeCheck = lambda x: lower(x, min) and upper(x, max)
         self._setup(doc, dtype=dtype, default=default, check=None, optional=optional, source=source,
                     deprecated=deprecated)
         self.rangeString = "%s%s,%s%s" % \
@@ -122,7 +134,6 @@ class RangeField(Field):
 
     def _validateValue(self, value):
         Field._validateValue(self, value)
-        if not self.minCheck(value, self.min) or \
-                not self.maxCheck(value, self.max):
+        if not self._rangeCheck(value):
             msg = "%s is outside of valid range %s" % (value, self.rangeString)
             raise ValueError(msg)
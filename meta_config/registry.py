@@ -36,6 +36,8 @@ class ConfigurableWrapper:
     or contain one that is being overridden.
     """
 
+    __slots__ = ("ConfigClass", "_target")
+
     def __init__(self, target, ConfigClass):
         self.ConfigClass = ConfigClass
         self._target = target
@@ -72,6 +74,11 @@ class Registry(collections.abc.Mapping):
       return a PSF matching class that has a ``psfMatch`` method with a
       particular call signature.
 
+    The read-only mapping methods (``__contains__``, `get`, `keys`, `values`
+    and `items`) read the underlying `dict` directly rather than going through
+    ``__getitem__`` and ``__iter__``. Subclasses that override
+    ``__getitem__`` or ``__iter__`` must override these methods as well.
+
     Examples
     --------
     This examples creates a configurable class ``Foo`` and adds it to a
@@ -167,6 +174,21 @@ class Registry(collections.abc.Mapping):
     def __contains__(self, key):
         return key in self._dict
 
+    # Forward the read-only mapping API straight to the underlying dict so
+    # lookups do not go through the generic collections.abc implementations;
+    # see the class Notes for what this means for subclasses.
+    def get(self, key, default=None):
+        return self._dict.get(key, default)
+
+    def keys(self):
+        return self._dict.keys()
+
+    def values(self):
+        return self._dict.values()
+
+    def items(self):
+        return self._dict.items()
+
     def makeField(self, doc, default=None, optional=False, multi=False):
         """Create a `RegistryField` configuration field from this registry.
 
@@ -201,6 +223,8 @@ class RegistryAdaptor(collections.abc.Mapping):
         `Registry` instance.
     """
 
+    __slots__ = ("registry",)
+
     def __init__(self, registry):
         self.registry = registry
 
@@ -216,6 +240,19 @@ class RegistryAdaptor(collections.abc.Mapping):
     def __contains__(self, k):
         return k in self.registry
 
+    def __deepcopy__(self, memo):
+        """Snapshot the registry for a frozen `RegistryField`.
+
+        `ConfigChoiceField.freeze` copies the typemap so that a frozen config
+        does not see later registrations. Only the mapping of names to
+        targets needs copying; the registered targets are shared.
+        """
+        if not isinstance(self.registry, Registry):
+            return RegistryAdaptor(copy.deepcopy(self.registry, memo))
+        registry = copy.copy(self.registry)
+        registry._dict = dict(self.registry._dict)
+        return RegistryAdaptor(registry)
+
 
 class RegistryInstanceDict(ConfigInstanceDict):
     """Dictionary of instantiated configs, used to populate a `RegistryField`.
@@ -28,6 +28,7 @@ import re
 import os
 import pickle
 import unittest
+import unittest.mock
 
 import lsst.utils.tests
 import lsst.pex.config as pexConfig
@@ -136,12 +137,8 @@ class ConfigTest(unittest.TestCase):
         self.outer.i.f = 10.
         self.outer.validate()
 
-        try:
+        with self.assertRaises(pexConfig.FieldValidationError):
             self.simple.d["failKey"] = "failValue"
-        except pexConfig.FieldValidationError:
-            pass
-        except Exception:
-            raise "Validation error Expected"
         self.simple.validate()
 
         self.outer.i = InnerConfig
@@ -234,6 +231,21 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(self.comp.c.f, roundTrip.c.f)
         self.assertEqual(self.comp.r.name, roundTrip.r.name)
 
+        # a file that changes between loads is read again, even when the new
+        # contents have the same size and modification time
+        with open("roundtrip.test", "w") as outfile:
+            outfile.write("config.i = 1\n")
+        stat = os.stat("roundtrip.test")
+        simple = Simple()
+        simple.load("roundtrip.test")
+        self.assertEqual(simple.i, 1)
+        with open("roundtrip.test", "w") as outfile:
+            outfile.write("config.i = 2\n")
+        os.utime("roundtrip.test", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        simple.load("roundtrip.test")
+        os.remove("roundtrip.test")
+        self.assertEqual(simple.i, 2)
+
         # test backwards compatibility feature of allowing "root" instead of "config"
         outfile = open("roundtrip.test", "w")
         self.comp.saveToStream(outfile, root="root")
@@ -305,6 +317,52 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(III.a.default, 5)
         self.assertEqual(AAA.a.default, 4)
 
+    def testUpdate(self):
+        self.simple.update(i=5, f=2.0)
+        self.assertEqual(self.simple.i, 5)
+        self.assertEqual(self.simple.f, 2.0)
+        self.assertRaises(KeyError, self.simple.update, missing=1)
+
+    def testSelfAssignment(self):
+        inner = self.outer.i
+        nInner = len(inner.history["f"])
+        nOuter = len(self.outer.history["i"])
+        self.outer.i = self.outer.i
+        self.assertIs(self.outer.i, inner)
+        self.assertEqual(self.outer.i.f, 5.0)
+        self.assertEqual(len(inner.history["f"]), nInner)
+        self.assertEqual(len(self.outer.history["i"]), nOuter + 1)
+
+    def testHistoryLimit(self):
+        simple = Simple()
+        with unittest.mock.patch.object(pexConfig.config, "_HISTORY_MAX", 3):
+            for i in range(10):
+                simple.i = i
+        self.assertIsInstance(simple.history["i"], list)
+        self.assertEqual([h[0] for h in simple.history["i"]], [7, 8, 9])
+        self.assertEqual(simple.history["i"][-1:][0][0], 9)
+
+        simple = Simple()
+        with unittest.mock.patch.object(pexConfig.config, "_HISTORY_MAX", 0):
+            for i in range(10):
+                simple.i = i
+        self.assertEqual(len(simple.history["i"]), 11)
+
+    def testIteration(self):
+        self.assertEqual(list(self.simple.iterkeys()), self.simple.keys())
+        self.assertEqual(list(self.simple.itervalues()), self.simple.values())
+        self.assertEqual(list(self.simple.iteritems()), self.simple.items())
+
+    def testAddField(self):
+        """Test that fields added to an existing Config class are used."""
+        class AAA(pexConfig.Config):
+            a = pexConfig.Field("AAA.a", int, default=4)
+
+        AAA.b = pexConfig.Field("AAA.b", int, default=3)
+        aaa = AAA()
+        self.assertEqual(aaa.b, 3)
+        self.assertEqual(aaa.toDict(), {"a": 4, "b": 3})
+
     def testConvert(self):
         pol = pexConfig.makePolicy(self.simple)
         self.assertEqual(pol.exists("i"), False)
@@ -120,6 +120,18 @@ class ConfigChoiceFieldTest(unittest.TestCase):
                           setattr, self.config.c, "names", "AAA")
         self.config.c.names = ["AAA"]
 
+        # a generator is consumed only once
+        self.config.c.names = (name for name in ("AAA", "BBB"))
+        self.assertEqual(set(self.config.c.names), set(["AAA", "BBB"]))
+
+        # active follows in place modification of the selection
+        self.config.c.names = ["AAA"]
+        self.assertEqual(self.config.c.active, [self.config.c["AAA"]])
+        self.config.c.names.add("BBB")
+        self.assertEqual(len(self.config.c.active), 2)
+        self.config.c.names.discard("AAA")
+        self.assertEqual(self.config.c.active, [self.config.c["BBB"]])
+
     def testNoneValue(self):
         self.config.a = None
         self.assertRaises(pexConfig.FieldValidationError, self.config.validate)
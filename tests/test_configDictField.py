@@ -41,37 +41,21 @@ class Config3(pexConfig.Config):
 
 class ConfigDictFieldTest(unittest.TestCase):
     def testConstructor(self):
-        try:
+        with self.assertRaises(Exception, msg="Unsupported keytypes should not be allowed"):
             class BadKeytype(pexConfig.Config):
                 d = pexConfig.ConfigDictField("...", keytype=list, itemtype=Config1)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Unsupported keytypes should not be allowed")
 
-        try:
+        with self.assertRaises(Exception, msg="Unsupported itemtypes should not be allowed"):
             class BadItemtype(pexConfig.Config):
                 d = pexConfig.ConfigDictField("...", keytype=int, itemtype=dict)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Unsupported itemtypes should not be allowed")
 
-        try:
+        with self.assertRaises(Exception, msg="Non-callable itemCheck should not be allowed"):
             class BadItemCheck(pexConfig.Config):
                 d = pexConfig.ConfigDictField("...", keytype=str, itemtype=Config1, itemCheck=4)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Non-callable itemCheck should not be allowed")
 
-        try:
+        with self.assertRaises(Exception, msg="Non-callable dictCheck should not be allowed"):
             class BadDictCheck(pexConfig.Config):
                 d = pexConfig.DictField("...", keytype=int, itemtype=Config1, dictCheck=4)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Non-callable dictCheck should not be allowed")
 
     def testAssignment(self):
         c = Config2()
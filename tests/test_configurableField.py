@@ -50,29 +50,18 @@ class Config2(pexConf.Config):
 
 class ConfigurableFieldTest(unittest.TestCase):
     def testConstructor(self):
-        try:
+        with self.assertRaises(Exception, msg="Uncallable targets should not be allowed"):
             class BadTarget(pexConf.Config):
                 d = pexConf.ConfigurableField("...", target=None)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Uncallable targets should not be allowed")
 
-        try:
+        with self.assertRaises(Exception, msg="Missing ConfigClass should not be allowed"):
             class NoConfigClass(pexConf.Config):
                 d = pexConf.ConfigurableField("...", target=Target2)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Missing ConfigClass should not be allowed")
 
-        try:
+        with self.assertRaises(Exception,
+                               msg="ConfigClass that are not subclasses of Config should not be allowed"):
             class BadConfigClass(pexConf.Config):
                 d = pexConf.DictField("...", target=Target2, ConfigClass=Target2)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("ConfigClass that are not subclasses of Config should not be allowed")
 
     def testBasics(self):
         c = Config2()
@@ -35,37 +35,21 @@ class Config1(pexConfig.Config):
 
 class DictFieldTest(unittest.TestCase):
     def testConstructor(self):
-        try:
+        with self.assertRaises(Exception, msg="Unsupported keyptype DictFields should not be allowed"):
             class BadKeytype(pexConfig.Config):
                 d = pexConfig.DictField("...", keytype=list, itemtype=int)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Unsupported keyptype DictFields should not be allowed")
 
-        try:
+        with self.assertRaises(Exception, msg="Unsupported itemtype DictFields should not be allowed"):
             class BadItemtype(pexConfig.Config):
                 d = pexConfig.DictField("...", keytype=int, itemtype=dict)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Unsupported itemtype DictFields should not be allowed")
 
-        try:
+        with self.assertRaises(Exception, msg="Non-callable itemCheck DictFields should not be allowed"):
             class BadItemCheck(pexConfig.Config):
                 d = pexConfig.DictField("...", keytype=int, itemtype=int, itemCheck=4)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Non-callable itemCheck DictFields should not be allowed")
 
-        try:
+        with self.assertRaises(Exception, msg="Non-callable dictCheck DictFields should not be allowed"):
             class BadDictCheck(pexConfig.Config):
                 d = pexConfig.DictField("...", keytype=int, itemtype=int, dictCheck=4)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Non-callable dictCheck DictFields should not be allowed")
 
     def testAssignment(self):
         c = Config1()
@@ -23,9 +23,12 @@
 #
 
 import unittest
+import unittest.mock
 import lsst.utils.tests
 import lsst.pex.config as pexConfig
 import lsst.pex.config.history as pexConfigHistory
+import lsst.pex.config.callStack as pexConfigCallStack
+from lsst.pex.config.callStack import getCallerFrame, getCallStack
 
 
 class PexTestConfig(pexConfig.Config):
@@ -76,6 +79,44 @@ class HistoryTest(unittest.TestCase):
     testMethod()
     b.update(a=4.0)""", output)
 
+    def testStackBeyondOutermostFrame(self):
+        self.assertIsNone(getCallerFrame(10000))
+        self.assertEqual(getCallStack(skip=10000), [])
+
+    def testCallStackLimit(self):
+        def nested(depth, limit):
+            if depth > 0:
+                return nested(depth - 1, limit)
+            return getCallStack(limit=limit)
+
+        stack = nested(5, 3)
+        self.assertEqual(len(stack), 3)
+        self.assertEqual([frame.function for frame in stack], ["nested"]*3)
+        self.assertGreater(len(nested(5, 0)), 6)
+
+    def testNoCallStacks(self):
+        previous = pexConfigCallStack.setRecordCallStacks(False)
+        try:
+            b = PexTestConfig()
+            b.update(a=4.0)
+        finally:
+            self.assertFalse(pexConfigCallStack.setRecordCallStacks(previous))
+        self.assertEqual([h[0] for h in b.history["a"]], [1.0, 4.0])
+        self.assertEqual(list(b.history["a"][-1][1]), [])
+        pexConfigHistory.Color.colorize(False)
+        output = pexConfigHistory.format(b, "a")
+        self.assertTrue(output.startswith("a\n1.0"))
+        self.assertNotEqual(getCallStack(), [])
+
+    def testRecordCallStacksFromEnvironment(self):
+        for value, expected in (("0", False), ("off", False), ("FALSE", False),
+                                ("1", True), ("yes", True), ("True", True)):
+            with unittest.mock.patch.dict("os.environ", {"TEST_RECORD_CALL_STACKS": value}):
+                self.assertIs(pexConfigCallStack._getEnvBool("TEST_RECORD_CALL_STACKS", None), expected)
+        with unittest.mock.patch.dict("os.environ", {"TEST_RECORD_CALL_STACKS": "maybe"}):
+            with self.assertWarns(UserWarning):
+                self.assertTrue(pexConfigCallStack._getEnvBool("TEST_RECORD_CALL_STACKS", True))
+
 
 class TestMemory(lsst.utils.tests.MemoryTestCase):
     pass
@@ -57,37 +57,21 @@ class Config2(pexConfig.Config):
 
 class ListFieldTest(unittest.TestCase):
     def testConstructor(self):
-        try:
+        with self.assertRaises(Exception, msg="Unsupported dtype ListFields should not be allowed"):
             class BadDtype(pexConfig.Config):
                 ll = pexConfig.ListField("...", list)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("Unsupported dtype ListFields should not be allowed")
 
-        try:
+        with self.assertRaises(ValueError, msg="minLnegth <= maxLength should not be allowed"):
             class BadLengths(pexConfig.Config):
                 ll = pexConfig.ListField("...", int, minLength=4, maxLength=2)
-        except ValueError:
-            pass
-        else:
-            raise SyntaxError("minLnegth <= maxLength should not be allowed")
 
-        try:
+        with self.assertRaises(Exception, msg="negative length should not be allowed"):
             class BadLength(pexConfig.Config):
                 ll = pexConfig.ListField("...", int, length=-1)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("negative length should not be allowed")
 
-        try:
+        with self.assertRaises(Exception, msg="negative max length should not be allowed"):
             class BadLength2(pexConfig.Config):
                 ll = pexConfig.ListField("...", int, maxLength=-1)
-        except Exception:
-            pass
-        else:
-            raise SyntaxError("negative max length should not be allowed")
 
     def testAssignment(self):
         c = Config1()
@@ -22,6 +22,7 @@
 # see <http://www.lsstcorp.org/LegalNotices/>.
 #
 
+import copy
 import unittest
 import lsst.utils.tests
 import lsst.pex.config as pexConfig
@@ -90,6 +91,9 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(self.registry["foo21"].ConfigClass, self.fooConfig1Class)
 
         self.assertEqual(set(self.registry.keys()), set(("foo1", "foo2", "foo21")))
+        self.assertEqual(self.registry.get("foo1"), self.fooAlg1Class)
+        self.assertIsNone(self.registry.get("bar"))
+        self.assertEqual(dict(self.registry.items())["foo2"].ConfigClass, self.fooConfig2Class)
 
     def testWrapper(self):
         wrapper21 = self.registry["foo21"]
@@ -126,6 +130,20 @@ class ConfigTest(unittest.TestCase):
         c.r = "foo2"
         c.r.apply()
 
+    def testFreeze(self):
+        class C1(pexConfig.Config):
+            r = self.registry.makeField("registry field")
+
+        c = C1()
+        c.freeze()
+        self.registry.register("foo3", self.fooAlg1Class, self.fooConfig1Class)
+        self.assertIn("foo3", self.registry)
+        self.assertNotIn("foo3", C1.r.typemap)
+        self.assertIs(C1.r.typemap.registry["foo2"], self.registry["foo2"])
+        self.assertIsInstance(C1.r.typemap.registry, pexConfig.Registry)
+        # Copying a registry directly still copies its wrappers.
+        self.assertIsNot(copy.deepcopy(self.registry)["foo2"], self.registry["foo2"])
+
     def testExceptions(self):
         class C1(pexConfig.Config):
             r = self.registry.makeField("registry field", multi=True, default=[])